@@ -3,78 +3,199 @@
 """Configuration management for daily summary."""
 
 import os
+import re
+import sys
+import marshal
 from pathlib import Path
 
 
+# 로컬 .env 경로 (load_env와 캘린더 설정 저장이 같은 파일을 사용)
+ENV_PATH = Path(__file__).parent / ".env"
+
+# `python -m config --compile`로 생성하는 .env 스냅샷 모듈
+SNAPSHOT_PATH = Path(__file__).parent / "env_snapshot.py"
+
+# KEY=VALUE 한 줄 (앞뒤 공백 허용, #으로 시작하는 주석 줄은 매칭되지 않음)
+_ENV_LINE_RE = re.compile(rb"^[ \t]*([^#\s=][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+
+# .env는 보통 수 KB 이내이므로 이 크기까지는 read 한 번으로 읽음
+_ENV_READ_SIZE = 1 << 16
+
+
+def _read_env_bytes(env_path):
+    """.env 전체를 bytes로 읽기 (os.read 한 번, 64KiB를 넘으면 일반 파일 읽기로 대체)"""
+    fd = os.open(env_path, os.O_RDONLY)
+    try:
+        data = os.read(fd, _ENV_READ_SIZE)
+    finally:
+        os.close(fd)
+    if len(data) < _ENV_READ_SIZE:
+        return data
+    return env_path.read_bytes()
+
+
+def _parse_env(env_path):
+    """.env 파일을 {키: 값} 딕셔너리로 파싱 (한 번에 읽고 정규식 한 번으로 스캔)"""
+    env = {}
+    for key, value in _ENV_LINE_RE.findall(_read_env_bytes(env_path)):
+        value = value.decode("utf-8")
+        # 따옴표 제거 (예: "value" -> value)
+        q = value[:1]
+        if (q == '"' or q == "'") and value[-1:] == q:
+            value = value[1:-1]
+        env[key.decode("utf-8")] = value
+    return env
+
+
+def compile_env_snapshot():
+    """.env를 파싱해 ENV = {...} 딕셔너리 리터럴을 담은 env_snapshot.py로 저장
+
+    스냅샷에는 생성 당시 .env의 (mtime, 크기)가 함께 기록되어,
+    .env가 수정되면 load_env()가 자동으로 스냅샷을 무시합니다.
+    """
+    st = ENV_PATH.stat()
+    env = _parse_env(ENV_PATH)
+    with open(SNAPSHOT_PATH, "w", encoding="utf-8") as f:
+        f.write("# -*- coding: utf-8 -*-\n")
+        f.write('"""자동 생성 파일 (python -m config --compile) — 직접 수정하지 마세요."""\n\n')
+        f.write(f"STAMP = {(st.st_mtime_ns, st.st_size)!r}\n")
+        f.write(f"ENV = {env!r}\n")
+    return SNAPSHOT_PATH
+
+
+def _load_env_snapshot(stamp):
+    """.env와 stamp가 일치하는 env_snapshot.py가 있으면 그 ENV를 반환"""
+    if not SNAPSHOT_PATH.exists():
+        return None
+    try:
+        import env_snapshot
+    except Exception:
+        return None
+    if getattr(env_snapshot, "STAMP", None) != stamp:
+        return None
+    return env_snapshot.ENV
+
+
 def load_env():
-    """로컬 .env 파일이 있으면 환경변수로 로드 (GitHub에는 올라가지 않음)"""
-    env_path = Path(__file__).parent / ".env"
-    if env_path.exists():
-        loaded_count = 0
-        with open(env_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # 따옴표 제거 (예: "value" -> value)
-                    if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    os.environ[key] = value
-                    loaded_count += 1
-        if loaded_count > 0:
-            print(f"✅ .env 파일에서 {loaded_count}개의 설정을 로드했습니다.")
-        return True
-    return False
-
-
-# 스크립트 실행 시 즉시 .env 로드
-load_env()
-
-CONFIG = {
-    # ActivityWatch API 연결 정보
-    "api_host": "127.0.0.1",
-    "api_port": 5600,
-
-    # 출력 디렉토리 (기본값: 홈 디렉토리/daily-summaries/)
-    "output_dir": str(Path.home() / "daily-summaries"),
-
-    # 최소 표시 기간 (초 단위, 이보다 작은 활동은 제외)
-    "min_duration_seconds": 10,
-
-    # 상위 표시 개수
-    "top_apps_count": 15,
-    "top_urls_count": 10,
-
-    # 생산성 시간대 정의 (시간 범위, 24시간 형식)
-    "productive_hours": [(9, 12), (14, 18)],  # 9-12시, 14-18시
-
-    # Cowork 세션 로그 디렉토리
-    # macOS: ~/Library/Application Support/Claude/projects/
-    # Linux: ~/.config/Claude/projects/
-    # 빈 문자열이면 Cowork 요약 생략
-    "cowork_log_dir": str(Path.home() / "Library" / "Application Support" / "Claude" / "projects"),
-
-    # Slack Incoming Webhook URL
-    # Slack 앱 → Incoming Webhooks 에서 발급
-    # 빈 문자열이면 Slack 전송 생략 (마크다운 파일만 생성)
-    "slack_webhook_url": "",  # 환경변수 SLACK_WEBHOOK_URL 또는 직접 입력
-    
-    # Gemini API Key (AI 요약용)
-    # 빈 문자열이면 AI 요약 생략
-    "gemini_api_key": "",  # 환경변수 GEMINI_API_KEY 또는 직접 입력
-
-    # macOS Calendar 설정
-    # 업무 캘린더 이름 목록 (macOS 캘린더 앱에 표시되는 이름)
-    # 비어있으면 최초 실행 시 사용자에게 선택을 요청하고 .env에 저장
-    "gcal_work_calendar_names": [],
-
-    # 반복(정규) 이벤트 기본 제외 여부
-    # True: 매일/매주 반복되는 정규 미팅 제외 (데일리스크럼 등)
-    "gcal_exclude_recurring": True,
-
-    # 반복 이벤트라도 포함할 이벤트 이름 키워드 (화이트리스트)
-    # 예: ["1:1", "주간OKR"] — 해당 키워드가 포함된 반복 미팅은 포함
-    "gcal_recurring_whitelist": [],
-}
+    """로컬 .env 파일이 있으면 환경변수로 로드 (GitHub에는 올라가지 않음)
+
+    파싱 결과는 .env 옆의 .env.cache에 (mtime, 크기)와 함께 marshal 형식으로 저장해 두고,
+    .env가 바뀌지 않았으면 다시 파싱하지 않고 캐시를 그대로 사용합니다.
+    `python -m config --compile`로 만든 env_snapshot.py가 최신이면 그것을 가장 먼저 사용합니다.
+    """
+    env_path = ENV_PATH
+    try:
+        st = env_path.stat()
+    except OSError:
+        return False
+
+    cache_path = env_path.with_name(".env.cache")
+    stamp = (st.st_mtime_ns, st.st_size)
+    env = _load_env_snapshot(stamp)
+    if env is None:
+        try:
+            with open(cache_path, "rb") as f:
+                cached_stamp, cached_env = marshal.load(f)
+            if cached_stamp == stamp:
+                env = cached_env
+        except Exception:
+            pass
+
+    if env is None:
+        env = _parse_env(env_path)
+        try:
+            with open(cache_path, "wb") as f:
+                marshal.dump((stamp, env), f)
+        except OSError:
+            pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 파싱)
+
+    os.environ.update(env)
+    # 로드 결과 출력은 DAILY_SUMMARY_VERBOSE가 설정된 경우에만 (cron 실행 시 불필요한 출력 방지)
+    if env and os.environ.get("DAILY_SUMMARY_VERBOSE"):
+        print(f"✅ .env 파일에서 {len(env)}개의 설정을 로드했습니다.")
+    return True
+
+
+def _build_config():
+    """기본 설정 딕셔너리 생성"""
+    home = Path.home()
+    return {
+        # ActivityWatch API 연결 정보
+        "api_host": "127.0.0.1",
+        "api_port": 5600,
+
+        # 출력 디렉토리 (기본값: 홈 디렉토리/daily-summaries/)
+        "output_dir": str(home / "daily-summaries"),
+
+        # 최소 표시 기간 (초 단위, 이보다 작은 활동은 제외)
+        "min_duration_seconds": 10,
+
+        # 상위 표시 개수
+        "top_apps_count": 15,
+        "top_urls_count": 10,
+
+        # 생산성 시간대 정의 (시간 범위, 24시간 형식)
+        "productive_hours": [(9, 12), (14, 18)],  # 9-12시, 14-18시
+
+        # Cowork 세션 로그 디렉토리
+        # macOS: ~/Library/Application Support/Claude/projects/
+        # Linux: ~/.config/Claude/projects/
+        # 빈 문자열이면 Cowork 요약 생략
+        "cowork_log_dir": str(home / "Library" / "Application Support" / "Claude" / "projects"),
+
+        # Slack Incoming Webhook URL
+        # Slack 앱 → Incoming Webhooks 에서 발급
+        # 빈 문자열이면 Slack 전송 생략 (마크다운 파일만 생성)
+        "slack_webhook_url": "",  # 환경변수 SLACK_WEBHOOK_URL 또는 직접 입력
+
+        # Gemini API Key (AI 요약용)
+        # 빈 문자열이면 AI 요약 생략
+        "gemini_api_key": "",  # 환경변수 GEMINI_API_KEY 또는 직접 입력
+
+        # macOS Calendar 설정
+        # 업무 캘린더 이름 목록 (macOS 캘린더 앱에 표시되는 이름)
+        # 비어있으면 최초 실행 시 사용자에게 선택을 요청하고 .env에 저장
+        "gcal_work_calendar_names": [],
+
+        # 반복(정규) 이벤트 기본 제외 여부
+        # True: 매일/매주 반복되는 정규 미팅 제외 (데일리스크럼 등)
+        "gcal_exclude_recurring": True,
+
+        # 반복 이벤트라도 포함할 이벤트 이름 키워드 (화이트리스트)
+        # 예: ["1:1", "주간OKR"] — 해당 키워드가 포함된 반복 미팅은 포함
+        "gcal_recurring_whitelist": [],
+    }
+
+
+_CONFIG = None
+
+
+def __getattr__(name):
+    """CONFIG는 처음 접근할 때 .env를 로드하고 생성 (PEP 562)"""
+    global _CONFIG
+    if name == "CONFIG":
+        if _CONFIG is None:
+            load_env()
+            _CONFIG = _build_config()
+        return _CONFIG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Daily Summary 설정 도구")
+    parser.add_argument("--compile", action="store_true", help=".env를 env_snapshot.py로 미리 변환하여 시작 시간을 단축")
+    args = parser.parse_args()
+
+    if not args.compile:
+        parser.print_help()
+        sys.exit(0)
+
+    if not ENV_PATH.exists():
+        print(f"❌ .env 파일을 찾을 수 없습니다: {ENV_PATH}", file=sys.stderr)
+        sys.exit(1)
+
+    snapshot_path = compile_env_snapshot()
+    print(f"✅ .env 스냅샷 생성: {snapshot_path}")
@@ -9,12 +9,12 @@ ActivityWatch 일일 요약 생성기
 
 import os
 import sys
-import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Import configuration and utilities
 from config import CONFIG
-from utils import get_daterange, is_holiday
+from utils import close_session, get_daterange, is_holiday
 
 # Import data fetchers
 from fetchers import fetch_all
@@ -30,6 +30,8 @@ from formatters import (
 
 def main():
     """메인 함수"""
+    import argparse
+
     parser = argparse.ArgumentParser(description="ActivityWatch Daily Summary Generator")
     parser.add_argument("date", nargs="?", help="요약할 날짜 (YYYYMMDD 형식). 생략 시 어제 또는 --today 옵션 사용")
     parser.add_argument("--today", action="store_true", help="오늘 날짜의 요약 생성 (기본값: 어제)")
@@ -83,30 +85,32 @@ def main():
     print("📝 마크다운 보고서 생성 중...")
     markdown_content = create_markdown_report(data, target_date)
 
-
-    # 파일 저장
-    print("💾 파일 저장 중...")
-    filepath = save_report(markdown_content, target_date)
-    print(f"✅ 보고서 저장: {filepath}")
-
-    # AI 요약 생성 및 추가
+    # AI 요약 생성 (Gemini 응답을 기다리는 동안 보고서 본문을 먼저 저장)
     gemini_api_key = CONFIG.get("gemini_api_key") or os.environ.get("GEMINI_API_KEY", "")
     ai_summary = None
-    
-    if gemini_api_key:
-        print("🤖 AI 요약 생성 중...")
-        ai_summary = summarize_with_gemini(markdown_content, gemini_api_key)
-        
-        if ai_summary:
-            print("✅ AI 요약 생성 완료!")
-            # MD 파일에 AI 요약 추가
-            with open(filepath, 'a', encoding='utf-8') as f:
-                f.write(f"\n\n---\n\n## 🤖 AI 요약 (Gemini)\n\n{ai_summary}\n")
-            print("✅ AI 요약을 MD 파일에 추가했습니다")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ai_future = None
+        if gemini_api_key:
+            print("🤖 AI 요약 생성 중...")
+            ai_future = executor.submit(summarize_with_gemini, markdown_content, gemini_api_key)
         else:
-            print("⚠️ AI 요약 생성 실패")
-    else:
-        print("ℹ️ Gemini API Key 미설정 — AI 요약 생략")
+            print("ℹ️ Gemini API Key 미설정 — AI 요약 생략")
+
+        # 파일 저장 (AI 요약이 실패하거나 오래 걸려도 보고서는 먼저 남김)
+        print("💾 파일 저장 중...")
+        filepath = save_report(markdown_content, target_date)
+        print(f"✅ 보고서 저장: {filepath}")
+
+        if ai_future is not None:
+            ai_summary = ai_future.result()
+            if ai_summary:
+                print("✅ AI 요약 생성 완료!")
+                # AI 요약을 끝에 붙여 같은 파일로 다시 저장
+                save_report(markdown_content, target_date, ai_summary)
+                print("✅ AI 요약을 MD 파일에 추가했습니다")
+            else:
+                print("⚠️ AI 요약 생성 실패")
 
     # Slack 전송
     slack_webhook_url = CONFIG.get("slack_webhook_url") or os.environ.get("SLACK_WEBHOOK_URL", "")
@@ -145,4 +149,7 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        sys.exit(main())
+    finally:
+        close_session()
@@ -1,11 +1,12 @@
-from daily_summary import fetch_antigravity_activity
 from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add current dir to path to import daily_summary
+# Add current dir to path to import fetchers
 sys.path.append(str(Path.cwd()))
 
+from fetchers.antigravity import fetch_antigravity_activity
+
 print(f"Testing fetch_antigravity_activity for today ({datetime.now()})")
 data = fetch_antigravity_activity(datetime.now())
 print(f"Result: {data}")
@@ -2,62 +2,174 @@
 # -*- coding: utf-8 -*-
 """ActivityWatch data fetchers."""
 
+import gzip
+import json
+import os
 import sys
-import requests
+import time
 from collections import defaultdict
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 from config import CONFIG
-from utils import get_api_url, get_bucket_id, get_bucket_ids
+from utils import get_api_url, get_bucket_id, get_bucket_ids, get_session, json_dumps, json_loads, url_netloc
+
+# 웹 버킷 동시 조회 최대 개수
+_MAX_WORKERS = 4
+
+# 이미 끝난 기간의 이벤트 캐시 디렉토리
+_EVENTS_CACHE_DIR = Path.home() / ".cache" / "daily-summary" / "aw-events"
+
+# 기간이 끝난 뒤 이만큼 지나야 캐시 (watcher가 남은 이벤트를 서버에 보내는 시간)
+_EVENTS_CACHE_GRACE = timedelta(hours=1)
+
+# 이보다 오래된 캐시 파일은 새 캐시를 저장할 때 삭제 (초)
+_EVENTS_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+def _events_cache_path(cache_key, start_iso, end_iso):
+    """이벤트 캐시 파일 경로 반환 (조회 기간이 끝난 지 _EVENTS_CACHE_GRACE가 지나지 않았으면 None)
+
+    지난 날짜의 이벤트는 더 이상 바뀌지 않으므로 한 번 받아 두면 재실행 시 그대로 사용할 수 있습니다.
+    오늘처럼 진행 중인 기간이나 막 끝난 기간(자정 직후 실행 등)은 이벤트가 더 들어올 수 있으므로 캐시하지 않습니다.
+    캐시 파일 이름에는 ActivityWatch 서버(host/port)도 포함합니다.
+    """
+    try:
+        if datetime.fromisoformat(end_iso) + _EVENTS_CACHE_GRACE > datetime.now(timezone.utc):
+            return None
+    except ValueError:
+        return None
+    name = f"{CONFIG['api_host']}_{CONFIG['api_port']}_{cache_key}_{start_iso}_{end_iso}"
+    name = name.replace(":", "").replace("+", "p")
+    return _EVENTS_CACHE_DIR / f"{name}.json.gz"
+
+
+def _prune_events_cache():
+    """_EVENTS_CACHE_MAX_AGE보다 오래된 이벤트 캐시 파일 삭제 (실패는 무시)"""
+    cutoff = time.time() - _EVENTS_CACHE_MAX_AGE
+    try:
+        with os.scandir(_EVENTS_CACHE_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def _cached_events(cache_key, start_iso, end_iso, fetch):
+    """fetch()로 이벤트 목록 조회 (지난 기간은 cache_key별 디스크 캐시 사용)"""
+    cache_path = _events_cache_path(cache_key, start_iso, end_iso)
+    if cache_path is not None:
+        try:
+            return json_loads(gzip.decompress(cache_path.read_bytes()))
+        except (OSError, ValueError, EOFError):
+            pass  # 캐시가 없거나 손상된 경우 다시 조회
+
+    events = fetch()
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            tmp_path.write_bytes(gzip.compress(json_dumps(events), compresslevel=1))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 조회)
+        _prune_events_cache()
+
+    return events
+
+
+def _query_events(cache_key, query, start_iso, end_iso):
+    """ActivityWatch 쿼리(/query/)를 지정 기간에 실행한 결과 (timeperiod별 이벤트 목록의 리스트, 지난 기간은 디스크 캐시 사용)
+
+    Args:
+        query: 쿼리 문장 리스트 (마지막에 RETURN = ...; 필요)
+    """
+    def request():
+        url = get_api_url("query/")
+        body = {
+            "timeperiods": [f"{start_iso}/{end_iso}"],
+            "query": query,
+        }
+        response = get_session().post(url, json=body, timeout=10)
+        response.raise_for_status()
+        return json_loads(response.content)
+
+    return _cached_events(cache_key, start_iso, end_iso, request)
+
+
+def _add_hourly(hourly_activity, timestamp, duration, tz):
+    """이벤트 시간을 시작 시각부터 1시간 경계마다 나눠 tz 기준 {시(0~23): 시간_초}에 더함"""
+    start = datetime.fromisoformat(timestamp).astimezone(tz)
+    while duration > 0:
+        next_hour = start.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        chunk = min(duration, (next_hour - start).total_seconds())
+        hourly_activity[start.hour] += chunk
+        duration -= chunk
+        start = next_hour
 
 
 def fetch_window_events(start_iso, end_iso):
-    """윈도우 활동 데이터 조회
+    """윈도우 활동 데이터 조회 (최소 표시 기간은 개별 이벤트에 적용)
+
+    쿼리는 서버에서 loginwindow 이벤트만 제외하고 나머지 개별 이벤트를 그대로 받습니다.
+    쿼리 언어에는 이벤트 길이 필터가 없어, 짧은 이벤트 제외와 앱별 합산은 여기서 처리하고,
+    같은 이벤트의 시작 시각으로 시간대별 활동 시간도 함께 구합니다 (조회 기간의 시간대 기준).
 
     Returns:
-        dict: {'앱이름': 총_시간_초} 형식의 딕셔너리
+        tuple: ({'앱이름': 총_시간_초}, {시(0~23): 활동_시간_초}) 형식의 딕셔너리 2개
     """
 
     bucket_id = get_bucket_id("currentwindow")
     if not bucket_id:
         print("⚠️ 윈도우 활동 버킷을 찾을 수 없습니다.", file=sys.stderr)
-        return {}
+        return {}, {}
 
-    try:
-        url = get_api_url(f"buckets/{bucket_id}/events")
-        params = {
-            "start": start_iso,
-            "end": end_iso,
-            "limit": -1,
-        }
+    min_duration = CONFIG["min_duration_seconds"]
 
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
+    # loginwindow(자리비움, Lock Screen) 제외는 서버에서 처리
+    query = [
+        f"events = query_bucket({json.dumps(bucket_id)});",
+        'events = exclude_keyvals(events, "app", ["loginwindow"]);',
+        "RETURN = events;",
+    ]
 
-        events = response.json()
+    try:
+        events = _query_events(f"{bucket_id}.window", query, start_iso, end_iso)[0]
         app_durations = defaultdict(float)
+        hourly_activity = defaultdict(float)
+        tz = datetime.fromisoformat(start_iso).tzinfo
 
         for event in events:
-            if "data" in event and "app" in event["data"]:
-                app_name = event["data"]["app"]
-                # loginwindow는 자리비움(Lock Screen) 상태이므로 제외
-                if app_name.lower() == "loginwindow":
-                    continue
-
-                duration = event.get("duration", 0)
-
-                if duration > CONFIG["min_duration_seconds"]:
-                    app_durations[app_name] += duration
-
-        return dict(app_durations)
+            data = event.get("data")
+            if not data:
+                continue
+            app_name = data.get("app")
+            # loginwindow는 자리비움(Lock Screen) 상태이므로 제외
+            # (macOS는 항상 소문자 "loginwindow"로 보고하므로 lower() 없이 비교)
+            if not app_name or app_name == "loginwindow":
+                continue
+            duration = event.get("duration", 0.0)
+            if duration > min_duration:
+                app_durations[app_name] += duration
+                _add_hourly(hourly_activity, event["timestamp"], duration, tz)
+
+        return dict(app_durations), dict(hourly_activity)
 
     except Exception as e:
         print(f"⚠️ 윈도우 활동 데이터 조회 실패: {e}", file=sys.stderr)
-        return {}
+        return {}, {}
 
 
 def fetch_web_events(start_iso, end_iso):
-    """웹 브라우징 활동 데이터 조회
+    """웹 브라우징 활동 데이터 조회 (최소 표시 기간은 개별 이벤트에 적용)
+
+    쿼리는 버킷의 개별 이벤트를 그대로 받고(서버 측 합산 없음), 짧은 이벤트 제외와 도메인별 합산은 여기서 처리합니다.
 
     Returns:
         dict: {'도메인': 총_시간_초} 형식의 딕셔너리
@@ -70,43 +182,49 @@ def fetch_web_events(start_iso, end_iso):
 
     domain_durations = defaultdict(float)
     url_details = []
-
-    # 모든 웹 버킷에서 데이터 수집
-    for bucket_id in bucket_ids:
-        try:
-            url = get_api_url(f"buckets/{bucket_id}/events")
-            params = {
-                "start": start_iso,
-                "end": end_iso,
-                "limit": -1,
-            }
-
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-
-            events = response.json()
+    add_url_detail = url_details.append
+    min_duration = CONFIG["min_duration_seconds"]
+
+    def query_urls(bucket_id):
+        query = [
+            f"events = query_bucket({json.dumps(bucket_id)});",
+            "RETURN = events;",
+        ]
+        return _query_events(f"{bucket_id}.web", query, start_iso, end_iso)[0]
+
+    # 모든 웹 버킷을 동시에 조회하고, 결과는 버킷 순서대로 집계
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(bucket_ids))) as executor:
+        futures = [executor.submit(query_urls, bucket_id) for bucket_id in bucket_ids]
+
+        for bucket_id, future in zip(bucket_ids, futures):
+            try:
+                events = future.result()
+            except Exception as e:
+                print(f"⚠️ 웹 활동 데이터 조회 실패 (버킷: {bucket_id}): {e}", file=sys.stderr)
+                continue
 
             for event in events:
-                if "data" in event:
-                    data = event["data"]
-                    event_url = data.get("url", "")
-                    duration = event.get("duration", 0)
-
-                    if duration > CONFIG["min_duration_seconds"] and event_url:
-                        try:
-                            domain = urlparse(event_url).netloc or event_url
-                            domain_durations[domain] += duration
-                            url_details.append({
-                                "url": event_url,
-                                "domain": domain,
-                                "duration": duration,
-                                "title": data.get("title", "")
-                            })
-                        except Exception:
-                            pass
-
-        except Exception as e:
-            print(f"⚠️ 웹 활동 데이터 조회 실패 (버킷: {bucket_id}): {e}", file=sys.stderr)
-            continue
+                data = event.get("data")
+                if not data:
+                    continue
+                duration = event.get("duration", 0.0)
+                if duration <= min_duration:
+                    continue
+                event_url = data.get("url")
+                if not event_url:
+                    continue
+
+                try:
+                    domain = url_netloc(event_url) or event_url
+                    domain_durations[domain] += duration
+                    add_url_detail({
+                        "url": event_url,
+                        "domain": domain,
+                        "duration": duration,
+                        # 제목은 여기서 한 번만 앞뒤 공백 제거
+                        "title": (data.get("title") or "").strip(),
+                    })
+                except Exception:
+                    pass
 
     return dict(domain_durations), url_details
@@ -11,6 +11,9 @@
     ─ daily_summary.py / markdown.py는 수정 불필요 ─
 """
 
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -23,6 +26,14 @@ from .antigravity import fetch_antigravity_activity
 from .calendar import fetch_calendar_events
 
 
+# fetch_all()에서 동시에 실행할 fetcher 최대 개수
+_MAX_WORKERS = 8
+
+# 소스별 최대 대기 시간 (초, 캘린더 조회가 끝난 시점 기준) — 넘기면 해당 소스만 빈 결과로 처리
+_AW_TIMEOUT = 60
+_SOURCE_TIMEOUT = 30
+
+
 @dataclass
 class FetchedData:
     """모든 fetcher 결과를 담는 컨테이너.
@@ -32,6 +43,7 @@ class FetchedData:
 
     # ActivityWatch (start_iso/end_iso 기반)
     app_durations: dict = field(default_factory=dict)
+    hourly_activity: dict = field(default_factory=dict)
     domain_durations: dict = field(default_factory=dict)
     url_details: list = field(default_factory=list)
 
@@ -51,6 +63,10 @@ def fetch_all(target_date: datetime, start_iso: str, end_iso: str) -> FetchedDat
 
     ✅ 새 fetcher를 추가하면 여기에 호출을 추가하세요.
 
+    캘린더를 제외한 소스는 스레드 풀에서 동시에 실행하고, 캘린더 조회가 끝난 시점부터
+    ActivityWatch는 _AW_TIMEOUT, 나머지는 _SOURCE_TIMEOUT초까지만 기다립니다.
+    캘린더는 메인 스레드에서 실행하며 시간 제한이 없습니다 (최초 실행 시 입력 대기 포함).
+
     Args:
         target_date: 요약 대상 날짜 (datetime)
         start_iso: 조회 시작 시각 (ISO 8601)
@@ -59,20 +75,66 @@ def fetch_all(target_date: datetime, start_iso: str, end_iso: str) -> FetchedDat
     Returns:
         FetchedData: 수집된 모든 데이터
     """
-    app_durations, (domain_durations, url_details) = (
-        fetch_window_events(start_iso, end_iso),
-        fetch_web_events(start_iso, end_iso),
-    )
+    defaults = FetchedData()
+
+    # 각 소스는 서로 독립적인 I/O(HTTP, 파일, git/osascript 실행) 대기이므로 스레드 풀에서 동시에 실행
+    executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
+    try:
+        window_future = executor.submit(fetch_window_events, start_iso, end_iso)
+        web_future = executor.submit(fetch_web_events, start_iso, end_iso)
+
+        # 날짜 기반 fetcher: {FetchedData 필드명: future}
+        futures = {
+            "cowork_sessions": executor.submit(fetch_cowork_sessions, target_date),
+            "claude_context": executor.submit(fetch_claude_context, target_date),
+            "firebender_tasks": executor.submit(fetch_firebender_activity, target_date),
+            "antigravity_data": executor.submit(fetch_antigravity_activity, target_date),
+            "claude_cli_history": executor.submit(fetch_claude_cli_history, target_date),
+            # ── 여기에 새 fetcher 호출 추가 ─────────────────
+        }
+
+        # 캘린더는 최초 실행 시 사용자 입력(업무 캘린더 선택)을 받을 수 있으므로 메인 스레드에서 실행
+        try:
+            calendar_events = fetch_calendar_events(target_date)
+        except Exception as e:
+            print(f"⚠️ calendar_events 조회 실패: {e}", file=sys.stderr)
+            calendar_events = defaults.calendar_events
+
+        # 대기 시간은 캘린더 조회(osascript, 사용자 입력)가 끝난 뒤부터 계산
+        # (느린 캘린더 때문에 곧 끝날 다른 소스까지 시간 초과로 버리지 않도록)
+        started = time.monotonic()
+        app_durations, hourly_activity = _result_or_default(
+            "window_events", window_future, started + _AW_TIMEOUT, (defaults.app_durations, defaults.hourly_activity)
+        )
+        domain_durations, url_details = _result_or_default(
+            "web_events", web_future, started + _AW_TIMEOUT, (defaults.domain_durations, defaults.url_details)
+        )
+        results = {
+            name: _result_or_default(name, future, started + _SOURCE_TIMEOUT, getattr(defaults, name))
+            for name, future in futures.items()
+        }
+    finally:
+        # 아직 시작하지 않은 작업은 취소하고 바로 반환 (시간 초과된 fetcher 결과는 사용하지 않음)
+        # 단, 실행 중인 작업 스레드는 중단되지 않고 인터프리터 종료 시 join되므로,
+        # 멈춘 소스(git log, HTTP 호출 등)가 있으면 그 작업이 끝날 때까지 프로세스 종료가 늦어짐
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return FetchedData(
         app_durations=app_durations,
+        hourly_activity=hourly_activity,
         domain_durations=domain_durations,
         url_details=url_details,
-        cowork_sessions=fetch_cowork_sessions(target_date),
-        claude_context=fetch_claude_context(target_date),
-        firebender_tasks=fetch_firebender_activity(target_date),
-        antigravity_data=fetch_antigravity_activity(target_date),
-        calendar_events=fetch_calendar_events(target_date),
-        claude_cli_history=fetch_claude_cli_history(target_date),
-        # ── 여기에 새 fetcher 호출 추가 ─────────────────
+        calendar_events=calendar_events,
+        **results,
     )
+
+
+def _result_or_default(name, future, deadline, default):
+    """deadline(time.monotonic 기준)까지 future 결과를 기다리고, 시간 초과·예외 시 default 반환"""
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        print(f"⚠️ {name} 조회 시간 초과 — 빈 결과로 진행합니다.", file=sys.stderr)
+    except Exception as e:
+        print(f"⚠️ {name} 조회 실패: {e}", file=sys.stderr)
+    return default
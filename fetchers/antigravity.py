@@ -3,11 +3,76 @@
 """Antigravity (Git) activity fetcher."""
 
 import os
-import glob
+import re
 import subprocess
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 
+# git log 출력에서 커밋 제목 줄을 표시하는 구분자 (ASCII Record Separator)
+_COMMIT_MARK = "\x1e"
+
+# overview.txt에서 "USER Objective:"가 있는 줄의 다음 줄 (다음 줄은 소비하지 않아 연속된 섹션도 찾음)
+_OBJECTIVE_RE = re.compile(r"USER Objective:[^\n]*\n(?=([^\n]*))")
+
+
+# git log 최대 실행 시간 (초)
+_GIT_TIMEOUT = 5
+
+# overview.txt 동시 읽기 스레드 수
+_MAX_WORKERS = 8
+
+
+def _read_overview(path):
+    """overview.txt 내용 반환 (없거나 읽기 실패 시 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _git_activity(work_dir, since, until):
+    """work_dir 저장소의 since~until 커밋 제목과 변경 파일 추출 (실패 시 None)
+
+    git log 출력을 파이프로 한 줄씩 읽으며 바로 분류하므로 전체 출력을 메모리에 모아두지 않습니다.
+    같은 저장소·기간은 프로세스 안에서 한 번만 git을 실행하도록 결과를 캐시합니다.
+
+    Returns:
+        tuple: (커밋 제목 튜플, 변경 파일 frozenset)
+    """
+    commit_messages = []
+    files_modified = set()
+
+    # 각 커밋은 "\x1e제목" 줄로 시작하고, 그 뒤에 변경 파일 목록이 이어짐
+    with subprocess.Popen(
+        ["git", "log", f"--since={since}", f"--until={until}", f"--pretty=format:{_COMMIT_MARK}%s", "--name-only"],
+        cwd=work_dir, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    ) as proc:
+        # 제한 시간이 지나면 git을 종료 (읽기 루프가 멈춰 있지 않도록)
+        timer = threading.Timer(_GIT_TIMEOUT, proc.kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                if line.startswith(_COMMIT_MARK):
+                    msg = line[len(_COMMIT_MARK):].strip()
+                    if msg:
+                        commit_messages.append(msg)
+                    continue
+                line = line.strip()
+                if line and ('/' in line or '.' in line):
+                    files_modified.add(line)
+            proc.wait()
+        finally:
+            timer.cancel()
+
+    if proc.returncode != 0:
+        return None
+    return tuple(commit_messages), frozenset(files_modified)
+
 
 def fetch_antigravity_activity(target_date):
     """해당 날짜의 Antigravity 활동 추출 (Git 이력 기반 + 대화 로그)"""
@@ -26,64 +91,53 @@ def fetch_antigravity_activity(target_date):
         if not work_dir.exists():
             continue
         try:
-            # 파일 변경 내역 추출
-            result = subprocess.run(
-                ["git", "log", f"--since={since}", f"--until={until}", "--name-only", "--pretty=format:"],
-                cwd=str(work_dir), capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    line = line.strip()
-                    if line and ('/' in line or '.' in line):
-                        files_modified.add(line)
-            
-            # 커밋 메시지 추출 (질문/활동 내역)
-            msg_result = subprocess.run(
-                ["git", "log", f"--since={since}", f"--until={until}", "--pretty=format:%s"],
-                cwd=str(work_dir), capture_output=True, text=True, timeout=5
-            )
-            if msg_result.returncode == 0 and msg_result.stdout:
-                for msg in msg_result.stdout.strip().split('\n'):
-                    msg = msg.strip()
-                    if msg:
-                        commit_messages.append(msg)
+            # 커밋 메시지(질문/활동 내역)와 변경 파일을 git log 한 번으로 추출
+            activity = _git_activity(str(work_dir), since, until)
+            if activity:
+                messages, files = activity
+                commit_messages.extend(messages)
+                files_modified.update(files)
         except Exception:
             continue
     
     # Antigravity 대화 로그에서 사용자 질문 추출
     brain_dir = Path.home() / ".gemini" / "antigravity" / "brain"
     if brain_dir.exists():
+        # 대상 날짜(로컬 시간)의 시작/끝 epoch — 수정 시간을 float 그대로 비교
+        day_start = start.replace(microsecond=0).timestamp()
+        day_end = end.replace(microsecond=0).timestamp()
         try:
-            # 해당 날짜의 대화 찾기
-            for conv_dir in brain_dir.iterdir():
-                if not conv_dir.is_dir():
-                    continue
-                
-                # 대화 디렉토리의 수정 시간 확인
+            # 해당 날짜의 대화 찾기 (scandir의 DirEntry로 타입/수정 시간 확인)
+            with os.scandir(brain_dir) as it:
+                entries = list(it)
+            overview_paths = []
+            for entry in entries:
                 try:
-                    mod_time = datetime.fromtimestamp(conv_dir.stat().st_mtime)
-                    if mod_time.date() != target_date.date():
+                    if not entry.is_dir():
                         continue
-                except Exception:
-                    continue
-                
-                # overview.txt에서 사용자 요청 추출
-                overview_path = conv_dir / ".system_generated" / "logs" / "overview.txt"
-                if overview_path.exists():
-                    try:
-                        with open(overview_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            # "USER Objective:" 섹션 찾기
-                            if "USER Objective:" in content:
-                                lines = content.split('\n')
-                                for i, line in enumerate(lines):
-                                    if "USER Objective:" in line and i + 1 < len(lines):
-                                        objective = lines[i + 1].strip()
-                                        if objective and len(objective) > 5:
-                                            user_queries.append(objective)
-                                            break
-                    except Exception:
+                    # 대화 디렉토리의 수정 시간 확인
+                    if not (day_start <= entry.stat().st_mtime < day_end):
                         continue
+                except OSError:
+                    continue
+                overview_paths.append(os.path.join(entry.path, ".system_generated", "logs", "overview.txt"))
+
+            # overview.txt는 스레드 풀로 동시에 읽고 (디스크 대기 시간 겹치기), 결과는 원래 순서대로 처리
+            if len(overview_paths) > 1:
+                with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(overview_paths))) as executor:
+                    contents = list(executor.map(_read_overview, overview_paths))
+            else:
+                contents = [_read_overview(path) for path in overview_paths]
+
+            # overview.txt에서 사용자 요청 추출
+            for content in contents:
+                # "USER Objective:" 섹션 찾기 (다음 줄이 사용자 요청)
+                if content and "USER Objective:" in content:
+                    for m in _OBJECTIVE_RE.finditer(content):
+                        objective = m.group(1).strip()
+                        if objective and len(objective) > 5:
+                            user_queries.append(objective)
+                            break
         except Exception:
             pass
     
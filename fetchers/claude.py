@@ -2,10 +2,58 @@
 # -*- coding: utf-8 -*-
 """Claude session log fetcher."""
 
-import json
+import mmap
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 
+from utils import json_loads
+
+# audit.jsonl에서 user/assistant 항목일 수 있는 줄 (JSON 파싱 전에 bytes로 먼저 걸러냄)
+_AUDIT_TYPE_RE = re.compile(rb'"type"\s*:\s*"(?:user|assistant)"')
+
+# 도구 입력에서 파일 경로를 담는 키 (도구마다 이름이 다름, 우선순위 순)
+_TOOL_PATH_KEYS = ('file_path', 'TargetFile', 'path', 'AbsolutePath')
+
+
+def _extract_tool_path(tool_input):
+    """도구 입력(dict)에서 대상 파일 경로 추출 (없으면 None)"""
+    for key in _TOOL_PATH_KEYS:
+        value = tool_input.get(key)
+        if value:
+            return value
+    return None
+
+
+def _iter_session_files(sessions_dir, min_mtime=None):
+    """sessions_dir 하위의 세션 메타데이터(*.json) 경로를 순회 (todos 경로 제외)
+
+    os.scandir로 직접 탐색해 DirEntry의 타입 정보를 그대로 사용하고,
+    todos가 포함된 디렉토리는 하위로 내려가지 않습니다.
+    min_mtime(epoch 초)을 주면 그보다 먼저 수정된 파일은 열지 않도록 건너뜁니다.
+    """
+    stack = [str(sessions_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if "todos" in entry.path:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith(".json"):
+                if min_mtime is not None:
+                    try:
+                        if entry.stat().st_mtime < min_mtime:
+                            continue
+                    except OSError:
+                        continue
+                yield Path(entry.path)
+
 
 def fetch_claude_context(target_date):
     """지정된 날짜의 Claude 세션 활동(의도 및 코드 변경)을 추출"""
@@ -15,24 +63,25 @@ def fetch_claude_context(target_date):
     if not sessions_dir.exists():
         return context_data
 
+    # 대상 날짜 범위를 epoch 밀리초로 미리 계산 (세션마다 datetime을 만들지 않고 숫자로 비교)
+    day_start_ms = target_date.replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000
+    day_end_ms = day_start_ms + 86400 * 1000
+
     # Find relevant sessions
-    for json_path in sessions_dir.rglob("*.json"):
+    # lastActivityAt이 대상 날짜라면 파일도 그 이후에 저장되었으므로, 그 전에 수정된 파일은 파싱하지 않음
+    for json_path in _iter_session_files(sessions_dir, min_mtime=day_start_ms / 1000):
         try:
-            if "todos" in str(json_path):
-                 continue
-
-            with open(json_path, 'r', encoding='utf-8') as f:
+            with open(json_path, 'rb') as f:
                 try:
-                    metadata = json.load(f)
-                except json.JSONDecodeError:
+                    metadata = json_loads(f.read())
+                except ValueError:
                     continue
 
             last_activity = metadata.get('lastActivityAt')
             if not last_activity:
                 continue
 
-            activity_date = datetime.fromtimestamp(last_activity / 1000).date()
-            if activity_date != target_date.date():
+            if not (day_start_ms <= last_activity < day_end_ms):
                 continue
 
             session_id = metadata.get('sessionId')
@@ -51,14 +100,13 @@ def fetch_claude_context(target_date):
             files_modified = set()
             full_messages = []  # For detailed reporting
             
-            # Helper to extract file path from tool input
-            def get_path(tool_input):
-                 return tool_input.get('file_path') or tool_input.get('TargetFile') or tool_input.get('path') or tool_input.get('AbsolutePath')
-
-            with open(audit_path, 'r', encoding='utf-8') as f:
+            with open(audit_path, 'rb') as f:
                 for line in f:
+                    # user/assistant 항목이 아닌 줄(시스템·도구 결과 등)은 파싱하지 않음
+                    if not _AUDIT_TYPE_RE.search(line):
+                        continue
                     try:
-                        entry = json.loads(line)
+                        entry = json_loads(line)
                         entry_type = entry.get('type')
                         
                         if entry_type == "user":
@@ -90,7 +138,7 @@ def fetch_claude_context(target_date):
                                         tool_name = item.get('name')
                                         tool_input = item.get('input', {})
                                         
-                                        fpath = get_path(tool_input)
+                                        fpath = _extract_tool_path(tool_input)
                                         if fpath:
                                             fname = Path(fpath).name
                                             if tool_name in ['write_to_file']:
@@ -98,7 +146,7 @@ def fetch_claude_context(target_date):
                                             elif tool_name in ['Edit', 'Replace', 'replace_file_content', 'multi_replace_file_content']:
                                                 files_modified.add(fname)
 
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
             
             # Duration calculation (approximate using metadata if audit timestamps missing)
@@ -126,25 +174,38 @@ def fetch_claude_context(target_date):
 
 
 def fetch_claude_cli_history(target_date):
-    """지정된 날짜의 Claude CLI 명령어 실행 이력을 추출"""
+    """지정된 날짜의 Claude CLI 명령어 실행 이력을 추출 (파일 끝에서부터 필요한 날짜까지만 읽음)"""
     history_path = Path.home() / ".claude/history.jsonl"
     cli_history = []
 
     if not history_path.exists():
         return cli_history
 
+    day_start_ms = target_date.replace(hour=0, minute=0, second=0, microsecond=0).timestamp() * 1000
+    day_end_ms = day_start_ms + 86400 * 1000
+    # history.jsonl은 시간순으로 추가되므로 끝에서부터 거꾸로 읽다가 이 시각보다 이전 항목이 나오면 중단
+    # (여러 세션이 동시에 기록해 순서가 조금 섞일 수 있으므로 대상 날짜보다 하루 앞까지 여유를 둠)
+    stop_before_ms = day_start_ms - 86400 * 1000
+
     try:
-        with open(history_path, 'r', encoding='utf-8') as f:
-            for line in f:
+        with open(history_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = len(mm)
+            while pos > 0:
+                nl = mm.rfind(b"\n", 0, pos)
+                line = mm[nl + 1:pos]
+                pos = max(nl, 0)
+                if len(line) < 2:
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     timestamp = entry.get('timestamp')
                     if not timestamp:
                         continue
 
                     # 타임스탬프가 밀리초 단위일 수 있음
-                    entry_date = datetime.fromtimestamp(timestamp / 1000)
-                    if entry_date.date() != target_date.date():
+                    if timestamp < stop_before_ms:
+                        break
+                    if not (day_start_ms <= timestamp < day_end_ms):
                         continue
                     
                     display_cmd = entry.get('display', '')
@@ -152,7 +213,7 @@ def fetch_claude_cli_history(target_date):
                         continue
 
                     cli_history.append({
-                        'timestamp': entry_date,
+                        'timestamp': datetime.fromtimestamp(timestamp / 1000),
                         'command': display_cmd,
                         'session_id': entry.get('sessionId')
                     })
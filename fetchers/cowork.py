@@ -3,13 +3,169 @@
 """Cowork session log fetcher."""
 
 import os
-import glob
-import json
+import pickle
 import re
-from datetime import datetime
-from urllib.parse import urlparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from itertools import repeat
+from pathlib import Path
 
 from config import CONFIG
+from utils import json_loads, url_netloc
+
+# 어시스턴트 응답에서 URL 추출
+_URL_RE = re.compile(r'https?://[^\s\)\]>"]+')
+# 결과 요약 줄 앞의 마크다운 기호 (#, *, >, -)
+_MD_PREFIX_RE = re.compile(r'^[#*>\-\s]+')
+# 파싱할 파일 합계가 이 크기(bytes) 이상일 때만 프로세스 풀에서 병렬 파싱
+# 측정값: 순차 파싱은 MB당 약 8ms, spawn 방식(macOS 기본) 풀 생성과 워커의 모듈 재import는
+# 워커 1개 약 110ms, 4개 약 320ms이므로 합계 수십 MB 미만이면 순차 처리가 더 빠름
+_PARALLEL_MIN_BYTES = 32 << 20
+# 병렬 파싱 워커 최대 개수 (워커마다 앱 모듈 전체를 다시 import하므로 적게 유지)
+_MAX_PARSE_WORKERS = 4
+
+
+def _find_jsonl_files(log_dir):
+    """log_dir 하위의 모든 .jsonl 파일 경로 반환 (숨김 항목 제외)
+
+    디렉토리별 (mtime, 하위 디렉토리, .jsonl 파일) 목록을 디스크에 캐시해 두고,
+    mtime이 그대로인 디렉토리는 다시 읽지 않습니다.
+    파일/디렉토리가 추가·삭제되면 해당 디렉토리의 mtime이 바뀌므로 그 디렉토리만 다시 읽습니다.
+    """
+    cache_path = Path.home() / ".cache" / "daily-summary" / "cowork_dirs.pkl"
+    try:
+        with open(cache_path, "rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        cache = {}
+
+    new_cache = {}
+    jsonl_files = []
+    stack = [log_dir]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            continue
+
+        cached = cache.get(dir_path)
+        if cached and cached[0] == mtime:
+            _, subdirs, files = cached
+        else:
+            subdirs, files = [], []
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir():
+                            subdirs.append(entry.name)
+                        elif entry.name.endswith(".jsonl"):
+                            files.append(entry.name)
+            except OSError:
+                continue
+
+        new_cache[dir_path] = (mtime, subdirs, files)
+        stack.extend(os.path.join(dir_path, name) for name in subdirs)
+        jsonl_files.extend(os.path.join(dir_path, name) for name in files)
+
+    if new_cache != cache:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(new_cache, f, protocol=5)
+        except OSError:
+            pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 탐색)
+
+    return jsonl_files
+
+
+def _parse_cowork_file(filepath, target_day):
+    """Cowork JSONL 파일 하나에서 target_day의 user/assistant 메시지 목록 추출
+
+    별도 프로세스에서도 실행되므로 모듈 최상위 함수로 두고, 결과만 반환합니다.
+    """
+    messages = []
+    add_message = messages.append
+    # ISO 8601 타임스탬프의 날짜 부분("YYYY-MM-DD")과 문자열로 먼저 비교
+    target_prefix = target_day.isoformat()
+
+    # 파일 전체를 bytes로 한 번에 읽고 줄 단위로 분리 (디코딩 없이 바로 파싱)
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except (IOError, PermissionError):
+        return messages
+
+    for line in data.splitlines():
+        # 빈 줄만 건너뛰고 strip 없이 바로 파싱 (앞뒤 공백은 JSON 파서가 허용)
+        if len(line) < 2:
+            continue
+        try:
+            entry = json_loads(line)
+        except ValueError:
+            continue
+
+        ts_str = entry.get("timestamp", "")
+        # 다른 날짜의 항목은 datetime을 만들지 않고 바로 건너뜀
+        if not isinstance(ts_str, str) or not ts_str.startswith(target_prefix):
+            continue
+
+        if entry.get("isMeta"):
+            continue
+
+        msg = entry.get("message", {})
+        role = msg.get("role", "")
+        if role not in ("user", "assistant"):
+            continue
+
+        content = msg.get("content", "")
+        if isinstance(content, list):
+            text_parts = []
+            for part in content:
+                if isinstance(part, dict) and part.get("type") == "text":
+                    text_parts.append(part.get("text", ""))
+            content = " ".join(text_parts)
+
+        if not content or len(content.strip()) < 2:
+            continue
+
+        # 시각(HH:MM)은 대상 날짜로 확인된 항목만 파싱
+        try:
+            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+
+        add_message({
+            "timestamp": ts.strftime("%H:%M"),
+            "role": role,
+            "content": content.strip(),
+        })
+
+    return messages
+
+
+def _parse_cowork_files(paths, target_day, total_bytes):
+    """여러 Cowork 파일을 파싱해 메시지를 파일 순서대로 합침
+
+    파일 합계(total_bytes)가 크면 CPU를 나눠 쓰도록 프로세스 풀에서 병렬로 파싱합니다.
+    """
+    if total_bytes >= _PARALLEL_MIN_BYTES and len(paths) > 1 and (os.cpu_count() or 1) > 1:
+        try:
+            max_workers = min(_MAX_PARSE_WORKERS, len(paths), os.cpu_count())
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(_parse_cowork_file, paths, repeat(target_day), chunksize=4)
+                return [message for messages in results for message in messages]
+        except (OSError, BrokenProcessPool) as e:
+            print(f"⚠️ Cowork 로그 병렬 파싱 실패, 순차 처리로 전환: {e}", file=sys.stderr)
+
+    raw_messages = []
+    for path in paths:
+        raw_messages.extend(_parse_cowork_file(path, target_day))
+    return raw_messages
 
 
 def fetch_cowork_sessions(target_date):
@@ -26,60 +182,25 @@ def fetch_cowork_sessions(target_date):
         return []
 
     raw_messages = []  # 시간순 전체 메시지 수집
+    target_day = target_date.date()
+    # 이 시각 이전에 마지막으로 수정된 파일에는 대상 날짜의 메시지가 있을 수 없음
+    # (메시지 timestamp의 시간대 차이를 고려해 대상 날짜 UTC 자정보다 하루 앞으로 여유를 둠)
+    min_mtime = datetime(target_day.year, target_day.month, target_day.day, tzinfo=timezone.utc).timestamp() - 86400
 
     try:
-        jsonl_files = glob.glob(os.path.join(log_dir, "**", "*.jsonl"), recursive=True)
-
-        for filepath in jsonl_files:
+        paths = []
+        total_bytes = 0
+        for filepath in _find_jsonl_files(log_dir):
             try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-
-                        ts_str = entry.get("timestamp", "")
-                        if not ts_str:
-                            continue
-                        try:
-                            ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                            entry_date = ts.date()
-                        except (ValueError, TypeError):
-                            continue
-                        if entry_date != target_date.date():
-                            continue
-
-                        if entry.get("isMeta"):
-                            continue
-
-                        msg = entry.get("message", {})
-                        role = msg.get("role", "")
-                        if role not in ("user", "assistant"):
-                            continue
-
-                        content = msg.get("content", "")
-                        if isinstance(content, list):
-                            text_parts = []
-                            for part in content:
-                                if isinstance(part, dict) and part.get("type") == "text":
-                                    text_parts.append(part.get("text", ""))
-                            content = " ".join(text_parts)
-
-                        if not content or len(content.strip()) < 2:
-                            continue
-
-                        raw_messages.append({
-                            "timestamp": ts.strftime("%H:%M"),
-                            "role": role,
-                            "content": content.strip(),
-                        })
-
-            except (IOError, PermissionError):
+                st = os.stat(filepath)
+            except OSError:
                 continue
+            if st.st_mtime < min_mtime:
+                continue
+            paths.append(filepath)
+            total_bytes += st.st_size
+
+        raw_messages = _parse_cowork_files(paths, target_day, total_bytes)
 
     except Exception as e:
         print(f"⚠️ Cowork 로그 조회 실패: {e}")
@@ -98,20 +219,22 @@ def fetch_cowork_sessions(target_date):
             # 뒤따르는 어시스턴트 응답 수집
             result_text = ""
             urls = []
+            seen_domains = set()  # urls에 이미 담긴 도메인
             j = i + 1
             while j < len(raw_messages) and raw_messages[j]["role"] == "assistant":
                 resp = raw_messages[j]["content"]
                 # 응답에서 URL 추출
-                found_urls = re.findall(r'https?://[^\s\)\]>"]+', resp)
+                found_urls = _URL_RE.findall(resp)
                 for u in found_urls:
-                    domain = urlparse(u).netloc
-                    if domain and domain not in [urlparse(x).netloc for x in urls]:
+                    domain = url_netloc(u)
+                    if domain and domain not in seen_domains:
+                        seen_domains.add(domain)
                         urls.append(u)
                 # 첫 응답의 첫 문장을 결과 요약으로 사용
                 if not result_text:
                     first_line = resp.split("\n")[0].strip()
                     # 마크다운 기호 제거
-                    first_line = re.sub(r'^[#*>\-\s]+', '', first_line)
+                    first_line = _MD_PREFIX_RE.sub('', first_line)
                     if len(first_line) > 80:
                         first_line = first_line[:80] + "..."
                     result_text = first_line
@@ -130,9 +253,9 @@ def fetch_cowork_sessions(target_date):
     merged_tasks = []
     for task in tasks:
         # 너무 짧은 메시지(2글자 이하)는 이전 작업의 후속으로 간주
+        # (후속 요청은 URL이 없는 경우만 해당하므로 이전 작업에 더할 URL도 없음)
         if merged_tasks and len(task["intent"]) <= 10 and not task["urls"]:
-            merged_tasks[-1]["urls"].extend(task["urls"])
-        else:
-            merged_tasks.append(task)
+            continue
+        merged_tasks.append(task)
 
     return merged_tasks
@@ -2,10 +2,14 @@
 # -*- coding: utf-8 -*-
 """Firebender (Android Studio) activity fetcher."""
 
+import mmap
+import os
 import re
-from datetime import datetime
 from pathlib import Path
 
+# <user_query> 태그 안의 사용자 요청 (여러 줄 가능, mmap한 파일 bytes에서 바로 검색)
+_USER_QUERY_RE = re.compile(rb'<user_query>(.*?)</user_query>', re.DOTALL)
+
 
 def fetch_firebender_activity(target_date):
     """지정된 날짜의 Firebender (Android Studio) 활동 추출"""
@@ -15,6 +19,10 @@ def fetch_firebender_activity(target_date):
     if not firebender_dir.exists():
         return activity_data
 
+    # 대상 날짜 범위 (epoch 초, 파일 수정 시간과 숫자로 바로 비교)
+    day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+    day_end = day_start + 86400
+
     # 프로젝트별로 탐색
     for project_dir in firebender_dir.iterdir():
         if not project_dir.is_dir():
@@ -26,27 +34,38 @@ def fetch_firebender_activity(target_date):
             
         project_name = project_dir.name
         
-        for md_file in latest_dir.glob("*.md"):
+        # 파일 수정 시간으로 해당 날짜 활동인지 확인 (scandir 항목의 stat으로 열기 전에 거름)
+        md_files = []
+        try:
+            with os.scandir(latest_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".md") or entry.name.startswith("."):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if day_start <= st.st_mtime < day_end:
+                        md_files.append((entry.path, st.st_size))
+        except OSError:
+            continue
+
+        for md_path, size in md_files:
+            # 빈 파일은 mmap할 수 없으므로 건너뜀
+            if size == 0:
+                continue
             try:
-                # 파일 수정 시간으로 해당 날짜 활동인지 확인
-                mod_time = datetime.fromtimestamp(md_file.stat().st_mtime).date()
-                if mod_time != target_date.date():
-                    continue
-                
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    
-                # <user_query> 태그 내용 추출
-                queries = re.findall(r'<user_query>(.*?)</user_query>', content, re.DOTALL)
-                for query in queries:
-                    query_text = query.strip()
-                    if query_text:
-                        # 너무 긴 쿼리는 생략하거나 자르기
-                        display_query = query_text[:150] + "..." if len(query_text) > 150 else query_text
-                        activity_data.append({
-                            "project": project_name,
-                            "query": display_query
-                        })
+                # 파일 전체를 문자열로 읽지 않고 mmap으로 검색, 찾은 <user_query> 부분만 디코딩
+                with open(md_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for m in _USER_QUERY_RE.finditer(mm):
+                        query_text = m.group(1).decode("utf-8", "replace").strip()
+                        if query_text:
+                            # 너무 긴 쿼리는 생략하거나 자르기
+                            display_query = query_text[:150] + "..." if len(query_text) > 150 else query_text
+                            activity_data.append({
+                                "project": project_name,
+                                "query": display_query
+                            })
             except Exception:
                 continue
                 
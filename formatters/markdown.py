@@ -4,15 +4,24 @@
 
 import os
 import sys
-import json
-import requests
+import heapq
 from pathlib import Path
 from collections import defaultdict
-from urllib.parse import urlparse
+from operator import itemgetter
 
 from config import CONFIG
-from utils import format_seconds
+from utils import format_seconds, get_session, json_dumps, json_loads, url_netloc
 
+# (이름, 시간_초) 항목의 정렬 키
+_BY_DURATION = itemgetter(1)
+
+# 앱 카테고리별 키워드 (모두 소문자, 앱 이름을 소문자로 바꿔 부분 일치 비교, 앞의 카테고리 우선)
+_CATEGORY_KEYWORDS = {
+    "개발": ("vscode", "visual studio", "android studio", "terminal", "iterm",
+           "cmd", "powershell", "intellij", "pycharm", "sublime"),
+    "브라우저": ("chrome", "firefox", "safari", "edge", "brave"),
+    "커뮤니케이션": ("slack", "teams", "discord", "telegram", "zoom", "mail"),
+}
 
 
 def categorize_apps(app_durations):
@@ -24,43 +33,23 @@ def categorize_apps(app_durations):
     Returns:
         dict: 카테고리별 앱 정보
     """
-    categories = {
-        "개발": {
-            "keywords": ["vscode", "visual studio", "android studio", "terminal", "iterm",
-                        "cmd", "powershell", "intellij", "pycharm", "sublime"],
-            "apps": defaultdict(float)
-        },
-        "브라우저": {
-            "keywords": ["chrome", "firefox", "safari", "edge", "brave"],
-            "apps": defaultdict(float)
-        },
-        "커뮤니케이션": {
-            "keywords": ["slack", "teams", "discord", "telegram", "zoom", "mail"],
-            "apps": defaultdict(float)
-        },
-    }
-
-    categorized = {cat: {"apps": {}} for cat in categories}
+    categorized = {cat: {"apps": {}} for cat in _CATEGORY_KEYWORDS}
     uncategorized = {}
 
     for app_name, duration in app_durations.items():
-        found = False
-        for category, info in categories.items():
-            for keyword in info["keywords"]:
-                if keyword.lower() in app_name.lower():
-                    categorized[category]["apps"][app_name] = duration
-                    found = True
-                    break
-            if found:
-                break
-
-        if not found:
+        app_lower = app_name.lower()
+        category = next(
+            (cat for cat, keywords in _CATEGORY_KEYWORDS.items() if any(k in app_lower for k in keywords)),
+            None,
+        )
+        if category is None:
             uncategorized[app_name] = duration
+        else:
+            categorized[category]["apps"][app_name] = duration
 
     # 카테고리별 소계 계산
-    for category in categories:
-        total = sum(categorized[category]["apps"].values())
-        categorized[category]["total"] = total
+    for info in categorized.values():
+        info["total"] = sum(info["apps"].values())
 
     categorized["기타"] = {
         "apps": uncategorized,
@@ -70,23 +59,17 @@ def categorize_apps(app_durations):
     return categorized
 
 
-def calculate_active_time(app_durations, domain_durations):
+def calculate_active_time(app_durations, domain_durations, hourly_activity=None):
     """전체 활동 시간 계산
 
+    Args:
+        hourly_activity: fetch_window_events가 구한 {시(0~23): 활동_시간_초}
+
     Returns:
         tuple: (총_활동_시간_초, 시간대별_활동_시간)
     """
     total = sum(app_durations.values())
-
-    # 시간대별 활동 시간 계산 (간단한 추정)
-    hourly_activity = defaultdict(float)
-    if app_durations:
-        avg_per_app = total / len(app_durations)
-        for i, (app, duration) in enumerate(sorted(app_durations.items(), key=lambda x: x[1], reverse=True)):
-            hour = i % 24
-            hourly_activity[hour] += duration
-
-    return total, dict(hourly_activity)
+    return total, dict(hourly_activity or {})
 
 
 def generate_productivity_summary(hourly_activity):
@@ -100,12 +83,17 @@ def generate_productivity_summary(hourly_activity):
     return productive_time
 
 
-def generate_one_liner(app_durations, domain_durations, total_time):
-    """한줄 요약 생성 (AI 없이 규칙 기반)"""
+def generate_one_liner(app_durations, domain_durations, total_time, top_app=None):
+    """한줄 요약 생성 (AI 없이 규칙 기반)
+
+    Args:
+        top_app: 이미 구한 가장 많이 쓴 (앱이름, 시간_초)가 있으면 전달 (없으면 여기서 계산)
+    """
     if not app_durations:
         return "오늘은 컴퓨터를 사용하지 않았습니다."
 
-    top_app = sorted(app_durations.items(), key=lambda x: x[1], reverse=True)[0]
+    if top_app is None:
+        top_app = max(app_durations.items(), key=_BY_DURATION)
     app_name = top_app[0]
     duration = format_seconds(top_app[1])
 
@@ -139,99 +127,105 @@ def create_markdown_report(data, target_date):
     calendar_events = data.calendar_events
     claude_cli_history = data.claude_cli_history
 
-    total_time, _ = calculate_active_time(app_durations, domain_durations)
+    total_time, _ = calculate_active_time(app_durations, domain_durations, data.hourly_activity)
 
-    report = f"# {target_date.strftime('%m/%d')} 일일 요약\n\n"
+    # 보고서는 조각 리스트로 모은 뒤 마지막에 한 번만 합침
+    parts = [f"# {target_date.strftime('%m/%d')} 일일 요약\n\n"]
+    add = parts.append
+
+    # 가장 많이 쓴 앱 상위 3개 (1줄 요약과 한줄 요약에서 함께 사용)
+    top_apps = heapq.nlargest(3, app_durations.items(), key=_BY_DURATION)
 
     # 1줄: 총 활동 시간 + 가장 많이 쓴 앱 상위 3개
     if app_durations:
-        top_apps = sorted(app_durations.items(), key=lambda x: x[1], reverse=True)[:3]
         apps_str = ", ".join(f"{name} {format_seconds(dur)}" for name, dur in top_apps)
-        report += f"**💻 {format_seconds(total_time)}** — {apps_str}\n\n"
+        add(f"**💻 {format_seconds(total_time)}** — {apps_str}\n\n")
 
     # 2줄: 주요 방문 사이트 + 핵심 페이지 제목
     if domain_durations:
-        top_domains = sorted(domain_durations.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_domains = heapq.nlargest(3, domain_durations.items(), key=_BY_DURATION)
+        # 상위 도메인의 페이지 제목별 시간을 url_details 한 번 순회로 집계 {도메인: {제목: 시간_초}}
+        top_domain_pages = {domain: defaultdict(float) for domain, _ in top_domains}
+        for p in url_details:
+            pages = top_domain_pages.get(p["domain"])
+            if pages is not None and p["title"]:
+                pages[p["title"]] += p["duration"]
+
         site_parts = []
         for rank, (domain, dur) in enumerate(top_domains, 1):
             # 해당 도메인에서 가장 오래 본 페이지 제목 1개
-            domain_pages = [u for u in url_details if u["domain"] == domain and u.get("title")]
-            page_durations = defaultdict(float)
-            for p in domain_pages:
-                title = p["title"].strip()
-                if title:
-                    page_durations[title] += p["duration"]
+            page_durations = top_domain_pages[domain]
             if page_durations:
-                top_page = sorted(page_durations.items(), key=lambda x: x[1], reverse=True)[0][0]
+                top_page = max(page_durations.items(), key=_BY_DURATION)[0]
                 # 페이지 제목이 너무 길면 자르기
                 if len(top_page) > 40:
                     top_page = top_page[:40] + "..."
                 site_parts.append(f"{rank}. {domain} ({top_page})")
             else:
                 site_parts.append(f"{rank}. {domain}")
-        report += f"**🌐 사이트** — {' / '.join(site_parts)}\n\n"
+        add(f"**🌐 사이트** — {' / '.join(site_parts)}\n\n")
 
     # 📅 미팅/일정 (macOS Calendar)
-    report += f"**📅 미팅/일정** ({len(calendar_events)}건)\n" if calendar_events else "**📅 미팅/일정**\n"
+    add(f"**📅 미팅/일정** ({len(calendar_events)}건)\n" if calendar_events else "**📅 미팅/일정**\n")
     if calendar_events:
         for ev in calendar_events:
             start_str = ev["start"].strftime("%H:%M")
             end_str = ev["end"].strftime("%H:%M")
-            report += f"- {start_str}~{end_str} {ev['title']} ({ev['duration_min']}분)\n"
+            add(f"- {start_str}~{end_str} {ev['title']} ({ev['duration_min']}분)\n")
     else:
-        report += "- (데이터 없음)\n"
-    report += "\n"
+        add("- (데이터 없음)\n")
+    add("\n")
 
     # 3~4줄: Cowork 작업 요약 (의도 + 결과 + 참고 리소스)
     cowork_tasks = cowork_sessions
-    report += f"**🤖 Cowork** ({len(cowork_tasks)}건)\n" if cowork_tasks else "**🤖 Cowork**\n"
+    add(f"**🤖 Cowork** ({len(cowork_tasks)}건)\n" if cowork_tasks else "**🤖 Cowork**\n")
     if cowork_tasks:
         for task in cowork_tasks[:7]:
             line = f"- {task['intent']}"
             if task["result"]:
                 line += f" — {task['result']}"
-            report += line + "\n"
+            add(line + "\n")
             # 참고한 URL이 있으면 도메인만 간결하게 표시
             if task["urls"]:
-                domains = [urlparse(u).netloc for u in task["urls"]]
-                report += f"  📎 {', '.join(domains)}\n"
+                domains = [url_netloc(u) for u in task["urls"]]
+                add(f"  📎 {', '.join(domains)}\n")
         if len(cowork_tasks) > 7:
-            report += f"- ...외 {len(cowork_tasks) - 7}건\n"
+            add(f"- ...외 {len(cowork_tasks) - 7}건\n")
     else:
-        report += "- (데이터 없음)\n"
-    report += "\n"
+        add("- (데이터 없음)\n")
+    add("\n")
 
     # 🤖 Claude 활동 (Local Agent)
-    report += f"**🤖 Claude 활동** ({len(claude_context)}건)\n" if claude_context else "**🤖 Claude 활동**\n"
+    add(f"**🤖 Claude 활동** ({len(claude_context)}건)\n" if claude_context else "**🤖 Claude 활동**\n")
     if claude_context:
         for session in claude_context:
             title = session.get('title', '세션')
             duration = session.get('duration_min', 0)
             count = session.get('interaction_count', 0)
             
-            report += f"### 📂 {title}\n"
-            report += f"> ⏱️ **{duration}분** 동안 **{count}번**의 상호작용\n\n"
+            add(f"### 📂 {title}\n")
+            add(f"> ⏱️ **{duration}분** 동안 **{count}번**의 상호작용\n\n")
             
-            report += f"**🎯 작업 목표**\n"
-            report += f"{session['goal']}\n\n"
+            add(f"**🎯 작업 목표**\n")
+            add(f"{session['goal']}\n\n")
             
             has_changes = False
             if session['files_created']:
-                report += f"- 🆕 **생성된 파일**: {', '.join(session['files_created'])}\n"
+                add(f"- 🆕 **생성된 파일**: {', '.join(session['files_created'])}\n")
                 has_changes = True
             if session['files_modified']:
-                report += f"- 📝 **수정된 파일**: {', '.join(session['files_modified'])}\n"
+                add(f"- 📝 **수정된 파일**: {', '.join(session['files_modified'])}\n")
                 has_changes = True
             
             if not has_changes:
-                report += "- ⚠️ 파일 변경 사항 없음\n"
+                add("- ⚠️ 파일 변경 사항 없음\n")
                 
-            report += "\n"
+            add("\n")
     else:
-        report += "- (데이터 없음)\n\n"
+        add("- (데이터 없음)\n\n")
 
     # 🤖 Firebender 활동 (Android Studio)
-    report += f"**🤖 Firebender (Android Studio)** ({len(firebender_tasks)}건)\n" if firebender_tasks else "**🤖 Firebender (Android Studio)**\n"
+    add(f"**🤖 Firebender (Android Studio)** ({len(firebender_tasks)}건)\n" if firebender_tasks else "**🤖 Firebender (Android Studio)**\n")
     if firebender_tasks:
         # 프로젝트별로 그룹화하여 표시
         by_project = defaultdict(list)
@@ -239,60 +233,60 @@ def create_markdown_report(data, target_date):
             by_project[t["project"]].append(t["query"])
             
         for project, queries in by_project.items():
-            report += f"### 📂 {project}\n"
+            add(f"### 📂 {project}\n")
             for q in queries:
-                report += f"- {q}\n"
+                add(f"- {q}\n")
 
-            report += "\n"
+            add("\n")
     else:
-        report += "- (데이터 없음)\n\n"
+        add("- (데이터 없음)\n\n")
 
 
     # 🤖 Antigravity 활동 (Self-Improvement)
-    report += "**🤖 Antigravity 활동 (Self-Improvement)**\n"
+    add("**🤖 Antigravity 활동 (Self-Improvement)**\n")
     user_queries = antigravity_data.get('user_queries', []) if antigravity_data else []
     commit_messages = antigravity_data.get('commit_messages', []) if antigravity_data else []
     files = antigravity_data.get('files_modified', []) if antigravity_data else []
     has_antigravity = bool(user_queries or commit_messages or files)
 
     if not has_antigravity:
-        report += "- (데이터 없음)\n"
+        add("- (데이터 없음)\n")
     else:
         # AI 프롬프트 (사용자 질문)
         if user_queries:
-            report += f"- 💬 **AI 프롬프트** ({len(user_queries)}건)\n"
+            add(f"- 💬 **AI 프롬프트** ({len(user_queries)}건)\n")
             for query in user_queries:
-                report += f"  - {query}\n"
+                add(f"  - {query}\n")
 
         # 커밋 메시지 (활동 내역)
         if commit_messages:
-            report += f"- 📝 **활동 내역** ({len(commit_messages)}건)\n"
+            add(f"- 📝 **활동 내역** ({len(commit_messages)}건)\n")
             for msg in commit_messages:
-                report += f"  - {msg}\n"
+                add(f"  - {msg}\n")
 
         # 수정된 파일
         if files:
-            report += f"- 🛠️ **수정된 파일** ({len(files)}개)\n"
+            add(f"- 🛠️ **수정된 파일** ({len(files)}개)\n")
             for f in files[:10]:
-                report += f"  - `{f}`\n"
+                add(f"  - `{f}`\n")
             if len(files) > 10:
-                report += f"  - ...외 {len(files) - 10}개\n"
-    report += "\n"
+                add(f"  - ...외 {len(files) - 10}개\n")
+    add("\n")
 
     # 🖥️ Claude CLI (터미널 기록)
     if claude_cli_history:
-        report += "---\n\n"
-        report += f"## 🖥️ Claude CLI ({len(claude_cli_history)}건)\n\n"
+        add("---\n\n")
+        add(f"## 🖥️ Claude CLI ({len(claude_cli_history)}건)\n\n")
         for item in claude_cli_history:
             timestamp = item['timestamp']
             cmd = item['command']
             time_str = timestamp.strftime("%H:%M:%S")
-            report += f"- `{time_str}` `{cmd}`\n"
-        report += "\n"
+            add(f"- `{time_str}` `{cmd}`\n")
+        add("\n")
 
     # 상세 활동 목록 (Detailed Lists)
-    report += "---\n\n"
-    report += "## 📋 상세 활동 목록\n\n"
+    add("---\n\n")
+    add("## 📋 상세 활동 목록\n\n")
     
     # Claude 전체 대화 목록
     if claude_context:
@@ -301,47 +295,54 @@ def create_markdown_report(data, target_date):
             full_messages = session.get('full_messages', [])
             
             if full_messages:
-                report += f"### 💬 Claude: {title}\n"
+                add(f"### 💬 Claude: {title}\n")
                 for idx, msg in enumerate(full_messages, 1):
                     # Truncate very long messages
                     display_msg = msg[:150] + "..." if len(msg) > 150 else msg
                     display_msg = display_msg.replace("\n", " ")
-                    report += f"{idx}. {display_msg}\n"
-                report += "\n"
+                    add(f"{idx}. {display_msg}\n")
+                add("\n")
     
     # 웹사이트 타이틀 목록
     if url_details:
-        report += "### 🌐 방문한 웹페이지\n"
+        add("### 🌐 방문한 웹페이지\n")
         # Collect unique titles with URLs
+        # (url_details의 제목은 fetch_web_events에서 이미 공백 제거됨, 처음 본 URL 유지)
         unique_pages = {}
         for u in url_details:
-            title = u.get("title", "").strip()
-            url = u.get("url", "")
-            if title and url and title not in unique_pages:
-                unique_pages[title] = url
+            if u["title"] and u["url"]:
+                unique_pages.setdefault(u["title"], u["url"])
         
         for idx, (title, url) in enumerate(sorted(unique_pages.items()), 1):
             display_title = title[:100] + "..." if len(title) > 100 else title
-            report += f"{idx}. [{display_title}]({url})\n"
-        report += "\n"
+            add(f"{idx}. [{display_title}]({url})\n")
+        add("\n")
 
     # 4줄: 한줄 요약
-    one_liner = generate_one_liner(app_durations, domain_durations, total_time)
-    report += f"> {one_liner}\n"
+    one_liner = generate_one_liner(app_durations, domain_durations, total_time, top_apps[0] if top_apps else None)
+    add(f"> {one_liner}\n")
+
+    return "".join(parts)
 
-    return report
 
+def save_report(markdown_content, target_date, ai_summary=None):
+    """보고서를 파일로 저장 (AI 요약이 있으면 끝에 붙여서 함께 저장)
 
-def save_report(markdown_content, target_date):
-    """보고서를 파일로 저장"""
+    임시 파일에 쓴 뒤 os.replace로 교체하므로, 저장 중 실패해도 기존 보고서가 깨지지 않습니다.
+    """
     output_dir = Path(CONFIG["output_dir"])
     output_dir.mkdir(parents=True, exist_ok=True)
 
     filename = f"{target_date.date().isoformat()}-daily-summary.md"
     filepath = output_dir / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
+    if ai_summary:
+        markdown_content += f"\n\n---\n\n## 🤖 AI 요약 (Gemini)\n\n{ai_summary}\n"
+
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
         f.write(markdown_content)
+    os.replace(tmp_path, filepath)
 
     return filepath
 
@@ -350,7 +351,7 @@ def summarize_with_gemini(md_content, api_key):
     """Gemini API를 사용하여 일일 요약을 5가지 핵심 포인트로 요약"""
     if not api_key:
         return None
-    
+
     try:
         url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}"
         
@@ -386,15 +387,17 @@ def summarize_with_gemini(md_content, api_key):
                 }]
             }]
         }
-        
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        response = requests.post(url, headers=headers, data=json.dumps(payload), timeout=60)
+
+        # 직렬화는 json_dumps(orjson 우선)로 직접 수행 — 한글 프롬프트를 \uXXXX로 이스케이프하지 않아 본문도 작아짐
+        response = get_session().post(
+            url,
+            data=json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=60,
+        )
         response.raise_for_status()
         
-        result = response.json()
+        result = json_loads(response.content)
         return result['candidates'][0]['content']['parts'][0]['text']
         
     except Exception as e:
@@ -4,9 +4,57 @@
 
 import re
 import sys
-import requests
 
 from config import CONFIG
+from utils import get_session, json_dumps
+
+# 마크다운 → Slack mrkdwn 변환 패턴 (한 번의 스캔으로 처리, 앞선 대안이 우선)
+# - link:     [텍스트](URL) -> <URL|텍스트> (Slack 형식), 괄호 사이 공백 허용
+# - linkparen: Fallback — [Title](URL)이 아니라 Title (URL) 형식으로 온 경우 (주로 AI 요약)
+#              예: - 🔗 GitHub PR (https://...) -> - <https://...|🔗 GitHub PR>
+#              ("](" 바로 뒤의 괄호는 일반 링크의 URL이므로 제외)
+# - h1:       # 제목 -> *제목*
+# - bold:     **bold** -> *bold*
+# - dash:     줄 머리 "- " -> "• "
+# - indent:   줄 머리 "  📎" 들여쓰기 보정
+_SLACK_MD_RE = re.compile(
+    r'(?P<link>\[(?P<link_text>[^\]]+)\]\s*\((?P<link_url>[^)]+)\))'
+    r'|(?P<linkparen>(?P<paren_text>🔗.*?)(?<![\]\s])\s*\((?P<paren_url>https?://[^)]+)\))'
+    r'|(?P<h1>^# (?P<h1_text>.+)$)'
+    r'|(?P<bold>\*\*(?P<bold_text>.+?)\*\*)'
+    r'|(?P<dash>^- )'
+    r'|(?P<indent>^  📎)',
+    re.MULTILINE,
+)
+
+
+# 링크 텍스트·제목·강조 안쪽 변환용 (줄 머리 규칙은 원래 줄의 시작에서만 적용되므로 제외)
+_SLACK_INLINE_RE = re.compile(
+    r'(?P<link>\[(?P<link_text>[^\]]+)\]\s*\((?P<link_url>[^)]+)\))'
+    r'|(?P<linkparen>(?P<paren_text>🔗.*?)(?<![\]\s])\s*\((?P<paren_url>https?://[^)]+)\))'
+    r'|(?P<bold>\*\*(?P<bold_text>.+?)\*\*)'
+)
+
+
+def _convert_match(m):
+    """_SLACK_MD_RE 매치 하나를 mrkdwn으로 변환 (링크 텍스트·제목 안의 강조 등은 다시 변환)"""
+    kind = m.lastgroup
+    if kind == "link":
+        return f"<{m['link_url']}|{_SLACK_INLINE_RE.sub(_convert_match, m['link_text'])}>"
+    if kind == "linkparen":
+        return f"<{m['paren_url']}|{_SLACK_INLINE_RE.sub(_convert_match, m['paren_text'])}>"
+    if kind == "h1":
+        return f"*{_SLACK_INLINE_RE.sub(_convert_match, m['h1_text'])}*"
+    if kind == "bold":
+        return f"*{_SLACK_INLINE_RE.sub(_convert_match, m['bold_text'])}*"
+    if kind == "dash":
+        return "• "
+    return "    📎"
+
+
+def _to_mrkdwn(text):
+    """마크다운 문자열을 Slack mrkdwn으로 변환 (정규식 한 번의 스캔)"""
+    return _SLACK_MD_RE.sub(_convert_match, text)
 
 
 def send_to_slack(markdown_content):
@@ -19,20 +67,7 @@ def send_to_slack(markdown_content):
         return False
 
     # 마크다운 → Slack mrkdwn 변환
-    slack_text = markdown_content
-    
-    # [텍스트](URL) -> <URL|텍스트> 변환 (Slack 형식)
-    # 괄호 사이 공백 허용 및 URL 매칭 개선
-    slack_text = re.sub(r'\[([^\]]+)\]\s*\(([^)]+)\)', r'<\2|\1>', slack_text)
-    
-    # Fallback: [Title](URL) 형식이 아니라 Title (URL) 형식으로 온 경우 (주로 AI 요약)
-    # 예: - 🔗 GitHub PR (https://...) -> - 🔗 <https://...|GitHub PR>
-    slack_text = re.sub(r'(🔗.*?)\s*\((https?://[^)]+)\)', r'<\2|\1>', slack_text)
-    
-    slack_text = re.sub(r'^# (.+)$', r'*\1*', slack_text, flags=re.MULTILINE)       # h1 → bold
-    slack_text = re.sub(r'\*\*(.+?)\*\*', r'*\1*', slack_text)                       # **bold** → *bold*
-    slack_text = re.sub(r'^\- ', '• ', slack_text, flags=re.MULTILINE)               # - → •
-    slack_text = re.sub(r'^  📎', '    📎', slack_text, flags=re.MULTILINE)          # 들여쓰기 보정
+    slack_text = _to_mrkdwn(markdown_content)
 
     payload = {
         "text": slack_text,
@@ -40,7 +75,13 @@ def send_to_slack(markdown_content):
     }
 
     try:
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        # 직렬화는 json_dumps(orjson 우선)로 직접 수행해 bytes 그대로 전송
+        response = get_session().post(
+            webhook_url,
+            data=json_dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=10,
+        )
         response.raise_for_status()
         return True
     except Exception as e:
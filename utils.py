@@ -2,68 +2,223 @@
 # -*- coding: utf-8 -*-
 """Utility functions for daily summary."""
 
+import os
 import sys
-import requests
-from datetime import date, timedelta
+import time
+import threading
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
 from config import CONFIG
 
+# JSON 파싱/직렬화: orjson(선택 설치)이 있으면 사용, 없으면 표준 json으로 대체
+# json_loads는 str/bytes를 받고 실패 시 ValueError(JSONDecodeError)를 발생시킴
+# json_dumps는 두 구현 모두 UTF-8로 인코딩된 bytes를 반환
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    import json
 
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        """obj를 UTF-8 JSON bytes로 직렬화 (orjson.dumps와 같은 형태)"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=1024)
 def format_seconds(seconds):
-    """초를 시간:분 형식으로 변환"""
+    """초를 시간:분 형식으로 변환 (보고서에서 같은 값을 여러 번 표시하므로 결과를 캐시)"""
     if seconds < 60:
         return f"{int(seconds)}초"
 
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
+    hours, rest = divmod(int(seconds), 3600)
+    minutes = rest // 60
 
     if hours > 0:
         return f"{hours}시간 {minutes}분"
     return f"{minutes}분"
 
 
+def _fast_netloc(url):
+    """scheme://host/... 형식 URL에서 host 부분만 문자열 연산으로 잘라냄 (못 찾으면 빈 문자열)"""
+    i = url.find("://")
+    # scheme은 영문자로 시작하고 영숫자와 + - . 만 포함 (아니면 scheme 없는 URL로 보고 포기)
+    if i <= 0 or not url[0].isalpha() or not url[:i].replace("+", "").replace("-", "").replace(".", "").isalnum():
+        return ""
+    rest = url[i + 3:]
+    for sep in "/?#":
+        j = rest.find(sep)
+        if j >= 0:
+            rest = rest[:j]
+    return rest
+
+
+@lru_cache(maxsize=4096)
+def url_netloc(url):
+    """URL의 도메인(netloc) 반환 (같은 URL이 반복되므로 결과를 캐시)
+
+    일반적인 http(s) URL은 문자열 연산으로 처리하고, 그 외에는 urlsplit으로 파싱합니다.
+    """
+    return _fast_netloc(url) or urlsplit(url).netloc
+
+
+# ActivityWatch·Slack·Gemini 호출이 함께 쓰는 HTTP 세션 (keep-alive), 첫 사용 시 생성
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session():
+    """공용 requests.Session 반환 (requests는 실제 HTTP 호출 시점에 import)
+
+    연결 풀을 재사용해 호출마다 새 TCP(TLS) 연결을 맺지 않도록 하고,
+    연결 실패 같은 일시적 오류와 GET의 502/503/504 응답(ActivityWatch 기동 중 등)은 짧게 재시도합니다.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            retry = Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                # 재시도 후에도 실패하면 마지막 응답을 그대로 돌려줘 호출부의 raise_for_status()가 처리
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_maxsize=16, max_retries=retry)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def close_session():
+    """공용 세션의 연결 풀을 닫음 (다음 get_session() 호출 때 새로 생성)"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+
+
+@lru_cache(maxsize=4)
+def _api_base(host, port):
+    """ActivityWatch API 기본 URL (host/port 조합별로 한 번만 생성)"""
+    return f"http://{host}:{port}/api/0/"
+
+
 def get_api_url(endpoint):
-    """ActivityWatch API URL 생성"""
-    return f"http://{CONFIG['api_host']}:{CONFIG['api_port']}/api/0/{endpoint}"
+    """ActivityWatch API URL 생성 (CONFIG의 host/port가 바뀌면 새 기본 URL 사용)"""
+    return _api_base(CONFIG["api_host"], CONFIG["api_port"]) + endpoint
 
 
-def get_bucket_id(bucket_type):
-    """지정된 타입의 첫 번째 버킷 ID 반환"""
+# 버킷 목록 캐시 (프로세스당 한 번만 조회, 여러 스레드에서 동시에 호출해도 한 번만 요청)
+_BUCKETS_CACHE = None
+_BUCKETS_LOCK = threading.Lock()
+
+# 실행 간 버킷 목록 디스크 캐시 (버킷은 거의 바뀌지 않으므로 1시간 동안 재사용)
+_BUCKETS_DISK_CACHE_PATH = Path.home() / ".cache" / "daily-summary" / "buckets.json"
+_BUCKETS_DISK_CACHE_TTL = 60 * 60
+
+
+def _read_buckets_disk_cache(url):
+    """같은 API URL로 저장된 버킷 목록 디스크 캐시 조회
+
+    Returns:
+        tuple: (버킷 목록 또는 None, ETag 또는 None, TTL 이내 여부)
+    """
     try:
-        # 버킷 목록 조회 (trailing slash 필수)
-        url = get_api_url("buckets/")
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        
-        buckets = response.json()
-        for bucket_id, bucket in buckets.items():
-            if bucket.get("type") == bucket_type:
-                return bucket_id
-                
+        age = time.time() - _BUCKETS_DISK_CACHE_PATH.stat().st_mtime
+        cached = json_loads(_BUCKETS_DISK_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None, None, False
+    if not isinstance(cached, dict) or cached.get("url") != url or cached.get("buckets") is None:
+        return None, None, False
+    return cached["buckets"], cached.get("etag"), age <= _BUCKETS_DISK_CACHE_TTL
+
+
+def _write_buckets_disk_cache(url, buckets, etag=None):
+    """버킷 목록(과 ETag)을 디스크 캐시에 저장 (실패는 무시)"""
+    try:
+        _BUCKETS_DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _BUCKETS_DISK_CACHE_PATH.with_name(_BUCKETS_DISK_CACHE_PATH.name + ".tmp")
+        tmp_path.write_bytes(json_dumps({"url": url, "etag": etag, "buckets": buckets}))
+        os.replace(tmp_path, _BUCKETS_DISK_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _load_buckets():
+    """ActivityWatch 버킷 목록 {버킷ID: 버킷정보} 반환 (첫 호출 때만 API 조회)
+
+    1시간 이내에 저장된 디스크 캐시가 있으면 API를 호출하지 않고,
+    그보다 오래됐으면 저장해 둔 ETag로 조건부 요청해 변경이 없으면(304) 캐시를 그대로 씁니다.
+    조회에 실패하면 예외를 그대로 전달하고, 다음 호출 때 다시 조회합니다.
+    """
+    global _BUCKETS_CACHE
+    with _BUCKETS_LOCK:
+        if _BUCKETS_CACHE is None:
+            # 버킷 목록 조회 (trailing slash 필수)
+            url = get_api_url("buckets/")
+            buckets, etag, fresh = _read_buckets_disk_cache(url)
+            if not fresh:
+                headers = {"If-None-Match": etag} if buckets is not None and etag else None
+                response = get_session().get(url, headers=headers, timeout=5)
+                if response.status_code == 304:
+                    # 변경 없음: 캐시 내용을 그대로 다시 저장해 TTL만 갱신
+                    _write_buckets_disk_cache(url, buckets, etag)
+                else:
+                    response.raise_for_status()
+                    buckets = json_loads(response.content)
+                    _write_buckets_disk_cache(url, buckets, response.headers.get("ETag"))
+            _BUCKETS_CACHE = buckets
+        return _BUCKETS_CACHE
+
+
+# 조회 실패 경고를 이미 출력한 버킷 타입 (ActivityWatch가 꺼져 있을 때 같은 경고 반복 방지)
+_BUCKET_WARNED = set()
+
+
+def _warn_bucket_failure(bucket_type, error):
+    """버킷 조회 실패 경고를 버킷 타입별로 한 번만 출력"""
+    if bucket_type in _BUCKET_WARNED:
+        return
+    _BUCKET_WARNED.add(bucket_type)
+    sys.stderr.write(f"⚠️ 버킷 조회 실패 ({bucket_type}): {error}\n")
+
+
+def get_buckets_by_types(bucket_types):
+    """여러 버킷 타입의 버킷 ID 리스트를 버킷 목록 한 번 순회로 조회 ({타입: [버킷 ID, ...]})"""
+    bucket_types = set(bucket_types)
+    result = {bucket_type: [] for bucket_type in bucket_types}
+    try:
+        for bucket_id, bucket in _load_buckets().items():
+            bucket_type = bucket.get("type")
+            if bucket_type in bucket_types:
+                result[bucket_type].append(bucket_id)
     except Exception as e:
-        print(f"⚠️ 버킷 조회 실패 ({bucket_type}): {e}", file=sys.stderr)
-    
-    return None
+        for bucket_type in bucket_types:
+            _warn_bucket_failure(bucket_type, e)
+        return {bucket_type: [] for bucket_type in bucket_types}
+
+    return result
+
+
+def get_bucket_id(bucket_type):
+    """지정된 타입의 첫 번째 버킷 ID 반환"""
+    bucket_ids = get_buckets_by_types((bucket_type,))[bucket_type]
+    return bucket_ids[0] if bucket_ids else None
 
 
 def get_bucket_ids(bucket_type):
     """지정된 타입의 모든 버킷 ID 리스트 반환"""
-    try:
-        url = get_api_url("buckets/")
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        
-        buckets = response.json()
-        matching_buckets = []
-        for bucket_id, bucket in buckets.items():
-            if bucket.get("type") == bucket_type:
-                matching_buckets.append(bucket_id)
-        
-        return matching_buckets
-                
-    except Exception as e:
-        print(f"⚠️ 버킷 조회 실패 ({bucket_type}): {e}", file=sys.stderr)
-    
-    return []
+    return get_buckets_by_types((bucket_type,))[bucket_type]
 
 
 def get_daterange(target_date):
@@ -72,11 +227,20 @@ def get_daterange(target_date):
     ActivityWatch API는 timezone suffix가 없으면 UTC로 해석하므로
     반드시 +09:00 suffix를 붙여야 KST 자정 기준으로 조회됩니다.
     """
-    start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end = start + timedelta(days=1)
+    return _daterange(target_date.date() if isinstance(target_date, datetime) else target_date)
+
 
-    # KST = UTC+9, isoformat()은 naive datetime이므로 suffix 수동 추가
-    return start.strftime("%Y-%m-%dT%H:%M:%S+09:00"), end.strftime("%Y-%m-%dT%H:%M:%S+09:00")
+# 하루 간격 (호출마다 timedelta를 새로 만들지 않도록 모듈 로드 시 한 번 생성)
+_ONE_DAY = timedelta(days=1)
+
+
+@lru_cache(maxsize=64)
+def _daterange(day):
+    """날짜(date)별 (시작, 끝) KST ISO 문자열 (같은 날짜는 한 번만 계산)"""
+    end = day + _ONE_DAY
+
+    # KST = UTC+9, 자정 시각과 suffix를 직접 붙임
+    return f"{day.isoformat()}T00:00:00+09:00", f"{end.isoformat()}T00:00:00+09:00"
 
 
 # ──────────────────────────────────────────────────────────────
@@ -123,6 +287,12 @@ _KR_HOLIDAYS: dict[int, set[tuple[int, int]]] = {
 }
 
 
+# 모든 공휴일을 date 하나의 집합으로 펼쳐 둠 (is_holiday에서 한 번의 조회로 확인)
+_HOLIDAYS = frozenset(
+    date(year, month, day) for year, holidays in _KR_HOLIDAYS.items() for month, day in holidays
+)
+
+
 def is_holiday(dt) -> bool:
     """주말 또는 한국 공휴일이면 True를 반환합니다.
 
@@ -132,16 +302,7 @@ def is_holiday(dt) -> bool:
     Returns:
         True if the date is a weekend or Korean public holiday.
     """
-    d = dt.date() if hasattr(dt, "date") else dt
-
-    # 토요일(5) 또는 일요일(6)
-    if d.weekday() >= 5:
-        return True
-
-    # 공휴일 데이터 조회
-    year_holidays = _KR_HOLIDAYS.get(d.year)
-    if year_holidays is None:
-        # 해당 연도 데이터 없으면 주말만 체크
-        return False
+    d = dt.date() if isinstance(dt, datetime) else dt
 
-    return (d.month, d.day) in year_holidays
+    # 토요일(5) 또는 일요일(6), 또는 공휴일 (해당 연도 데이터가 없으면 주말만 체크됨)
+    return d.weekday() >= 5 or d in _HOLIDAYS